@@ -8,9 +8,19 @@ import time
 import glob
 import json
 import socket
+import struct
 import argparse
+import logging
+import threading
 from pathlib import Path
 from enum import Enum
+from bisect import bisect_right
+from typing import NamedTuple, Optional
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QGroupBox, QLabel, QSlider, QPushButton,
@@ -18,91 +28,414 @@ from PyQt6.QtWidgets import (
     QGraphicsDropShadowEffect, QTabWidget, QCheckBox
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QThread, pyqtSignal, QSettings,
-    QPropertyAnimation, QEasingCurve
+    Qt, QObject, QTimer, pyqtSignal, pyqtSlot, QSettings,
+    QPropertyAnimation, QEasingCurve, QRunnable, QThreadPool, QDir
 )
 from PyQt6.QtGui import (
-    QIcon, QPixmap, QPainter, QFont, QAction, QColor,
+    QIcon, QImage, QPixmap, QPainter, QFont, QFontMetrics, QAction, QColor,
     QBrush, QPen, QLinearGradient, QRadialGradient
 )
 
 
+log = logging.getLogger('g15')
+# User-facing warnings (e.g. daemon unavailable) are shown by default;
+# --debug lowers this handler's level to include the polling trace.
+_log_handler = logging.StreamHandler()
+_log_handler.setLevel(logging.WARNING)
+log.addHandler(_log_handler)
+
+ASSETS_DIR = Path(__file__).resolve().parent / 'assets'
+
+
+APP_STYLE = """
+    QFrame[card="true"], QFrame[card="true"] QFrame {
+        background: white;
+        border: 2px solid #E0E0E0;
+        border-radius: 12px;
+    }
+
+    QWidget#fanControls {
+        background: #F8F9FA;
+        border-radius: 8px;
+    }
+    QPushButton#preset {
+        font-size: 11px;
+        font-weight: 500;
+        background: white;
+        color: #666666;
+        border: 1px solid #E0E0E0;
+        border-radius: 4px;
+    }
+    QPushButton#preset:hover {
+        background: #2196F3;
+        color: white;
+        border: 1px solid #2196F3;
+    }
+
+    QPushButton#manualToggle[state="on"] {
+        font-size: 12px;
+        font-weight: 600;
+        background: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 6px;
+    }
+    QPushButton#manualToggle[state="on"]:hover {
+        background: #1976D2;
+    }
+    QPushButton#manualToggle[state="off"] {
+        font-size: 12px;
+        font-weight: 500;
+        background: white;
+        color: #666666;
+        border: 2px solid #E0E0E0;
+        border-radius: 6px;
+    }
+    QPushButton#manualToggle[state="off"]:hover {
+        background: #F5F5F5;
+        border: 2px solid #2196F3;
+        color: #2196F3;
+    }
+
+    QPushButton#gModeButton[state="on"] {
+        font-size: 16px;
+        font-weight: bold;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #FF4444, stop:1 #CC0000);
+        color: white;
+        border: none;
+        border-radius: 25px;
+    }
+    QPushButton#gModeButton[state="on"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #FF6666, stop:1 #FF0000);
+    }
+    QPushButton#gModeButton[state="off"] {
+        font-size: 16px;
+        font-weight: bold;
+        background: white;
+        color: #666666;
+        border: 3px solid #E0E0E0;
+        border-radius: 25px;
+    }
+    QPushButton#gModeButton[state="off"]:hover {
+        background: #F5F5F5;
+        border: 3px solid #FF4444;
+        color: #FF4444;
+    }
+
+    QPushButton#modeButton {
+        font-size: 13px;
+        font-weight: 500;
+        text-align: left;
+        padding-left: 15px;
+        background: white;
+        color: #666666;
+        border: 2px solid #E0E0E0;
+        border-radius: 6px;
+    }
+    QPushButton#modeButton[selected="true"] {
+        font-weight: 600;
+        color: white;
+        border: none;
+    }
+"""
+
+DAEMON_DIALOG_STYLE = """
+    QMessageBox {
+        background: #F5F6FA;
+        font-family: "Segoe UI", Arial, sans-serif;
+    }
+    QMessageBox QLabel {
+        color: #2C3E50;
+        font-size: 12px;
+        padding: 15px;
+    }
+    QMessageBox QPushButton {
+        background: #2196F3;
+        color: white;
+        border: none;
+        padding: 8px 24px;
+        border-radius: 6px;
+        font-weight: 600;
+        font-size: 11px;
+        min-width: 80px;
+    }
+    QMessageBox QPushButton:hover {
+        background: #1976D2;
+    }
+"""
+
+MAIN_WINDOW_STYLE = """
+    QMainWindow {
+        background: #F5F6FA;
+    }
+"""
+
+HEADER_TITLE_STYLE = """
+    font-size: 24px;
+    font-weight: bold;
+    color: #2C3E50;
+    background: #F5F6FA;
+"""
+
+MODEL_LABEL_STYLE = """
+    font-size: 12px;
+    color: #666666;
+    padding: 4px 10px;
+    background: white;
+    border: 1px solid #E0E0E0;
+    border-radius: 12px;
+"""
+
+TABS_STYLE = """
+    QTabWidget::pane {
+        background: transparent;
+        border: none;
+    }
+    QTabBar::tab {
+        background: white;
+        color: #666666;
+        padding: 8px 16px;
+        margin-right: 4px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        font-weight: 500;
+    }
+    QTabBar::tab:selected {
+        color: #2C3E50;
+        border-bottom: 2px solid #2196F3;
+    }
+"""
+
+INFO_PANEL_STYLE = """
+    QFrame {
+        background: white;
+        border: 2px solid #E0E0E0;
+        border-radius: 12px;
+        padding: 15px;
+    }
+"""
+
+SECTION_STYLE = "QFrame { background: transparent; }"
+
+INFO_TEXT_STYLE = """
+    font-size: 12px;
+    color: #666666;
+    line-height: 1.5;
+"""
+
+INFO_TEXT = """
+<b>Instruções:</b><br><br>
+• <b>Modo-G:</b> Ativa resfriamento máximo<br>
+• <b>Modos de Energia:</b> Escolha seu perfil térmico<br>
+• <b>Controle Manual:</b> Selecione modo Personalizado primeiro<br>
+• <b>Bandeja do Sistema:</b> Duplo-clique para mostrar/ocultar<br><br>
+<b>Hardware:</b> Controlador Dell G15"""
+
+AUTOSTART_CHECKBOX_STYLE = """
+    QCheckBox {
+        font-size: 13px;
+        font-weight: 500;
+        color: #333333;
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:unchecked {
+        border: 2px solid #CCCCCC;
+        border-radius: 3px;
+        background: white;
+    }
+    QCheckBox::indicator:checked {
+        border: 2px solid #2196F3;
+        border-radius: 3px;
+        background: #2196F3;
+        image: url(g15:check.svg);
+    }
+"""
+
+
 class PowerMode(Enum):
     QUIET = ("Silencioso", "0xa3", "#4CAF50")
     BALANCED = ("Balanceado", "0xa0", "#2196F3")
     PERFORMANCE = ("Performance", "0xa1", "#FF9800")
     CUSTOM = ("Personalizado", "0xa2", "#9C27B0")
 
+    @property
+    def label(self) -> str:
+        return self.value[0]
+
+    @property
+    def code(self) -> str:
+        return self.value[1]
+
+    @property
+    def color(self) -> str:
+        return self.value[2]
+
+
+MODE_BY_NAME = {mode.label: mode for mode in PowerMode}
+
+MODE_BUTTON_STYLE = "".join(f"""
+    QPushButton#modeButton[mode="{mode.name}"][selected="true"] {{
+        background: {mode.color};
+    }}
+    QPushButton#modeButton[mode="{mode.name}"][selected="false"]:hover {{
+        background: #F5F5F5;
+        color: {mode.color};
+        border: 2px solid {mode.color};
+    }}
+""" for mode in PowerMode)
+
+
+def set_style_state(widget, name: str, value):
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class SensorData(NamedTuple):
+    cpu_temp: int
+    gpu_temp: Optional[int]
+    fan1_rpm: int
+    fan2_rpm: int
+    fan1_boost: int
+    fan2_boost: int
+    fan1_manual: bool
+    fan2_manual: bool
+    power_mode: PowerMode
+    g_mode: bool
+    gpu_suspended: bool
+
+
+MAX_MESSAGE_SIZE = 64 * 1024
+FRAME_HEADER = struct.Struct('>I')
+
 
 class G15DaemonClient:
     def __init__(self):
         self.socket_path = "/tmp/g15-daemon.sock"
+        self._sock = None
+        self._sock_lock = threading.Lock()
+        self._use_msgpack = False
         self.daemon_available = self._check_daemon()
         self.session_token = None
         self._cached_data = None
+        self._snapshot = None
         self._last_update = 0
         self._cache_timeout = 1.0
+        self.model = "Unknown"
 
         if self.daemon_available:
             self._authenticate()
+            self.model = self._get_all_data().get("status", {}).get("model", "Unknown")
+        else:
+            log.warning("G15 Daemon not available")
+
+        if self.model != "Unknown":
+            self.model_display = f"Modelo: Dell G15 {self.model}"
         else:
-            print("G15 Daemon not available")
+            self.model_display = "Modelo: Dell G15"
 
     def _check_daemon(self) -> bool:
+        test_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            if not os.path.exists(self.socket_path):
-                return False
-
-            try:
-                stat_info = os.stat(self.socket_path)
-            except Exception as e:
-                return False
-
-            test_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            test_socket.settimeout(1.0)
+            test_socket.settimeout(0.2)
             test_socket.connect(self.socket_path)
-            test_socket.close()
             return True
-        except Exception as e:
+        except OSError as e:
+            log.debug("Daemon socket %s not reachable: %s", self.socket_path, e)
             return False
+        finally:
+            test_socket.close()
 
     def _authenticate(self):
         try:
             response = self._send_request({"action": "authenticate"})
             if response.get("status") == "success":
                 self.session_token = response.get("token")
+                self._use_msgpack = msgpack is not None and response.get("msgpack", False)
         except:
             self.daemon_available = False
 
-    def _send_request(self, request_data: dict) -> dict:
-        if not self.daemon_available:
-            return {"status": "error", "message": "Daemon not available"}
+    def _connect(self) -> socket.socket:
+        client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client_socket.settimeout(5.0)
+        client_socket.connect(self.socket_path)
+        return client_socket
 
-        try:
-            client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            client_socket.settimeout(5.0)
-            client_socket.connect(self.socket_path)
+    def close(self):
+        with self._sock_lock:
+            self._close_socket()
 
-            if self.session_token and "token" not in request_data:
-                request_data["token"] = self.session_token
+    def _close_socket(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
 
-            request_json = json.dumps(request_data)
-            client_socket.send(request_json.encode('utf-8'))
+    def _recv_exact(self, size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = self._sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionResetError("daemon closed the connection")
+            buf += chunk
+        return bytes(buf)
 
-            response_data = client_socket.recv(4096)
-            client_socket.close()
+    def _send_request(self, request_data: dict) -> dict:
+        if not self.daemon_available:
+            return {"status": "error", "message": "Daemon not available"}
 
-            return json.loads(response_data.decode('utf-8'))
+        if self.session_token and "token" not in request_data:
+            request_data["token"] = self.session_token
 
-        except Exception as e:
-            pass
-            self.daemon_available = False
-            return {"status": "error", "message": str(e)}
+        if self._use_msgpack:
+            body = msgpack.packb(request_data, use_bin_type=True)
+        else:
+            body = json.dumps(request_data).encode('utf-8')
+        request_frame = FRAME_HEADER.pack(len(body)) + body
+
+        with self._sock_lock:
+            while True:
+                reused = self._sock is not None
+                replied = False
+                try:
+                    if self._sock is None:
+                        self._sock = self._connect()
+
+                    self._sock.sendall(request_frame)
+                    header = self._recv_exact(FRAME_HEADER.size)
+                    replied = True
+                    (length,) = FRAME_HEADER.unpack(header)
+                    if length > MAX_MESSAGE_SIZE:
+                        raise ValueError(f"daemon reply too large ({length} bytes)")
+
+                    response_data = self._recv_exact(length)
+                    if self._use_msgpack:
+                        return msgpack.unpackb(response_data, raw=False)
+                    return json.loads(response_data.decode('utf-8'))
+
+                except Exception as e:
+                    self._close_socket()
+                    if (reused and not replied and
+                            isinstance(e, (BrokenPipeError, ConnectionResetError))):
+                        # Stale connection (e.g. daemon restarted); retry once on a fresh one.
+                        # Timeouts are not retried: the daemon may still be running the
+                        # request, and actions like toggle_g_mode are not idempotent.
+                        continue
+                    log.debug("Daemon request %s failed: %s", request_data.get("action"), e)
+                    self.daemon_available = False
+                    return {"status": "error", "message": str(e)}
 
     def _get_all_data(self) -> dict:
-        import time
-
-        current_time = time.time()
+        current_time = time.monotonic()
         if (self._cached_data is None or
             current_time - self._last_update > self._cache_timeout):
 
@@ -119,47 +452,70 @@ class G15DaemonClient:
                         "fan1_manual": False, "fan2_manual": False
                     },
                     "power": {"current_mode": "Balanceado", "g_mode": False},
-                    "status": {"model": "Unknown", "hwmon_available": False, "g_mode_active": False}
+                    "status": {"model": "Unknown", "hwmon_available": False, "g_mode_active": False,
+                               "gpu_suspended": False}
                 }
+            self._snapshot = self._to_snapshot(self._cached_data)
 
         return self._cached_data
 
+    @staticmethod
+    def _to_snapshot(data: dict) -> SensorData:
+        temps = data.get("temps", {})
+        fans = data.get("fans", {})
+        power = data.get("power", {})
+        return SensorData(
+            cpu_temp=temps.get("cpu_temp", 45),
+            gpu_temp=temps.get("gpu_temp", 50),
+            fan1_rpm=fans.get("fan1_rpm", 2500),
+            fan2_rpm=fans.get("fan2_rpm", 2300),
+            fan1_boost=fans.get("fan1_boost", 0),
+            fan2_boost=fans.get("fan2_boost", 0),
+            fan1_manual=fans.get("fan1_manual", False),
+            fan2_manual=fans.get("fan2_manual", False),
+            power_mode=MODE_BY_NAME.get(power.get("current_mode"), PowerMode.BALANCED),
+            g_mode=power.get("g_mode", False),
+            gpu_suspended=data.get("status", {}).get("gpu_suspended", False)
+        )
+
+    def invalidate_cache(self):
+        self._cached_data = None
+
+    def get_snapshot(self) -> SensorData:
+        self._get_all_data()
+        return self._snapshot
+
     def get_cpu_temp(self) -> int:
-        data = self._get_all_data()
-        return data.get("temps", {}).get("cpu_temp", 45)
+        return self.get_snapshot().cpu_temp
 
-    def get_gpu_temp(self) -> int:
-        data = self._get_all_data()
-        return data.get("temps", {}).get("gpu_temp", 50)
+    def get_gpu_temp(self) -> Optional[int]:
+        return self.get_snapshot().gpu_temp
 
     def get_fan_rpm(self, fan_id: int) -> int:
-        data = self._get_all_data()
-        return data.get("fans", {}).get(f"fan{fan_id}_rpm", 2500 if fan_id == 1 else 2300)
+        snapshot = self.get_snapshot()
+        return snapshot.fan1_rpm if fan_id == 1 else snapshot.fan2_rpm
 
     def get_fan_boost(self, fan_id: int) -> int:
-        data = self._get_all_data()
-        return data.get("fans", {}).get(f"fan{fan_id}_boost", 0)
+        snapshot = self.get_snapshot()
+        return snapshot.fan1_boost if fan_id == 1 else snapshot.fan2_boost
     
     def get_fan_manual(self, fan_id: int) -> bool:
-        data = self._get_all_data()
-        return data.get("fans", {}).get(f"fan{fan_id}_manual", False)
+        snapshot = self.get_snapshot()
+        return snapshot.fan1_manual if fan_id == 1 else snapshot.fan2_manual
 
     def get_power_mode(self) -> PowerMode:
-        data = self._get_all_data()
-        mode_name = data.get("power", {}).get("current_mode", "Balanceado")
-        for mode in PowerMode:
-            if mode.value[0] == mode_name:
-                return mode
-        return PowerMode.BALANCED
+        return self.get_snapshot().power_mode
 
     def get_g_mode_status(self) -> bool:
-        data = self._get_all_data()
-        return data.get("power", {}).get("g_mode", False)
+        return self.get_snapshot().g_mode
+
+    def get_gpu_suspended(self) -> bool:
+        return self.get_snapshot().gpu_suspended
 
     def set_power_mode(self, mode: PowerMode) -> bool:
         response = self._send_request({
             "action": "set_power_mode",
-            "mode": mode.value[0]
+            "mode": mode.label
         })
         return response.get("status") == "success"
 
@@ -186,8 +542,6 @@ class AutoStartManager:
 
     def enable(self) -> bool:
         try:
-            self.autostart_dir.mkdir(parents=True, exist_ok=True)
-
             script_path = os.path.abspath(__file__)
             python_path = sys.executable
 
@@ -204,10 +558,22 @@ X-GNOME-Autostart-enabled=true
 X-GNOME-Autostart-Delay=5
 """
 
-            self.desktop_file.write_text(desktop_content)
-            os.chmod(self.desktop_file, 0o755)
+            try:
+                if self.desktop_file.read_text() == desktop_content:
+                    return True
+            except OSError:
+                pass
+
+            self.autostart_dir.mkdir(parents=True, exist_ok=True)
+
+            tmp_file = self.desktop_file.with_suffix('.desktop.tmp')
+            try:
+                tmp_file.write_text(desktop_content)
+                os.chmod(tmp_file, 0o755)
+                os.replace(tmp_file, self.desktop_file)
+            finally:
+                tmp_file.unlink(missing_ok=True)
 
-            pass
             return True
 
         except Exception as e:
@@ -225,73 +591,168 @@ X-GNOME-Autostart-Delay=5
             return False
 
 
-class SensorMonitor(QThread):
-    data_updated = pyqtSignal(dict)
+class _AutostartProbeSignals(QObject):
+    done = pyqtSignal(bool)
+
+
+class _AutostartProbe(QRunnable):
+    """Checks the autostart entry off the GUI thread (slow/NFS homes)."""
 
-    def __init__(self, daemon_client):
+    def __init__(self, manager: AutoStartManager):
         super().__init__()
+        self.manager = manager
+        self.signals = _AutostartProbeSignals()
+
+    def run(self):
+        self.signals.done.emit(self.manager.is_enabled())
+
+
+class SensorMonitor(QObject):
+    data_updated = pyqtSignal(object)
+
+    def __init__(self, daemon_client, parent=None):
+        super().__init__(parent)
         self.daemon_client = daemon_client
-        self.running = True
-
-    def _collect_data(self):
-        return {
-            'cpu_temp': self.daemon_client.get_cpu_temp(),
-            'gpu_temp': self.daemon_client.get_gpu_temp(),
-            'fan1_rpm': self.daemon_client.get_fan_rpm(1),
-            'fan2_rpm': self.daemon_client.get_fan_rpm(2),
-            'fan1_boost': self.daemon_client.get_fan_boost(1),
-            'fan2_boost': self.daemon_client.get_fan_boost(2),
-            'fan1_manual': self.daemon_client.get_fan_manual(1),
-            'fan2_manual': self.daemon_client.get_fan_manual(2),
-            'power_mode': self.daemon_client.get_power_mode(),
-            'g_mode': self.daemon_client.get_g_mode_status()
-        }
 
-    def update_once(self):
+        settings = QSettings("g15-control-center", "g15-control-center")
+        self.min_interval = settings.value("monitor/min_interval_ms", 500, type=int)
+        self.max_interval = settings.value("monitor/max_interval_ms", 2000, type=int)
+        self.idle_interval = settings.value("monitor/idle_interval_ms", 5000, type=int)
+        self.default_interval = 1000
+        self.stable_ticks_per_step = 5
+
+        self._active = True
+        self._last_data = None
+        self._stable_ticks = 0
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.default_interval)
+        self.poll_timer.timeout.connect(self._poll_sensors)
+
+    def _collect_data(self) -> SensorData:
+        # The timer sets the polling rate; bypass the client's snapshot TTL so a
+        # short interval really fetches fresh data instead of hitting the cache.
+        self.daemon_client.invalidate_cache()
+        return self.daemon_client.get_snapshot()
+
+    def _next_interval(self, data: SensorData) -> int:
+        hottest = max(data.cpu_temp, data.gpu_temp or 0)
+        if hottest > 80 or data.g_mode:
+            return self.min_interval
+
+        if (data.cpu_temp < 60 and
+            data.fan1_boost == 0 and data.fan2_boost == 0):
+            interval = self.max_interval
+        else:
+            interval = self.default_interval
+
+        if not self._active:
+            steps = self._stable_ticks // self.stable_ticks_per_step
+            interval = min(self.idle_interval, interval << min(steps, 8))
+        return interval
+
+    def _poll_sensors(self):
         try:
             data = self._collect_data()
             self.data_updated.emit(data)
         except Exception as e:
-            pass
+            log.debug("Sensor poll failed: %s", e)
+            return
 
-    def run(self):
-        update_count = 0
-        while self.running:
-            try:
-                update_count += 1
-                data = self._collect_data()
-                self.data_updated.emit(data)
+        if data == self._last_data:
+            self._stable_ticks += 1
+        else:
+            self._last_data = data
+            self._stable_ticks = 0
 
-                pass
+        log.debug("CPU=%d GPU=%s Fan1=%d Fan2=%d G-Mode=%s",
+                  data.cpu_temp, data.gpu_temp,
+                  data.fan1_rpm, data.fan2_rpm, data.g_mode)
 
-            except Exception as e:
-                pass
+        interval = self._next_interval(data)
+        if interval != self.poll_timer.interval():
+            self.poll_timer.setInterval(interval)
 
-            self.msleep(1000)
+    def update_once(self):
+        self._poll_sensors()
+
+    def set_active(self, active: bool):
+        if active == self._active:
+            return
+
+        self._active = active
+        self._stable_ticks = 0
+        if active and self.poll_timer.isActive():
+            self.poll_timer.setInterval(self.default_interval)
+            QTimer.singleShot(0, self._poll_sensors)
+
+    def start(self):
+        self.poll_timer.start()
+        QTimer.singleShot(0, self._poll_sensors)
 
     def stop(self):
-        self.running = False
-        self.wait()
+        self.poll_timer.stop()
 
 
 class ThermalCard(QFrame):
+    _STATUS_COLORS = (
+        ("#4CAF50", "#E8F5E9"),
+        ("#FFC107", "#FFF8E1"),
+        ("#FF9800", "#FFF3E0"),
+        ("#F44336", "#FFEBEE"),
+        ("#2196F3", "#E3F2FD"),
+        ("#9E9E9E", "#F5F5F5"),
+    )
+
+    _VALUE_STYLES = {color: f"""
+            font-size: 36px;
+            font-weight: bold;
+            color: {color};
+            padding: 5px;
+        """ for color, _ in _STATUS_COLORS}
+
+    _STATUS_STYLES = {(color, bg): f"""
+            font-size: 11px;
+            font-weight: 500;
+            color: {color};
+            padding: 3px 8px;
+            background: {bg};
+            border-radius: 8px;
+        """ for color, bg in _STATUS_COLORS}
+
+    _TEMP_BOUNDS = (50, 70, 85)
+    _TEMP_STYLES = (
+        ("#4CAF50", "Frio", "#E8F5E9"),
+        ("#FFC107", "Normal", "#FFF8E1"),
+        ("#FF9800", "Quente", "#FFF3E0"),
+        ("#F44336", "Muito Quente", "#FFEBEE"),
+    )
+
+    _RPM_BOUNDS = (2000, 4000)
+    _RPM_STYLES = (
+        ("#2196F3", "Baixo", "#E3F2FD"),
+        ("#4CAF50", "Normal", "#E8F5E9"),
+        ("#FF9800", "Alto", "#FFF3E0"),
+    )
+
+    _SUSPENDED_STYLE = ("#9E9E9E", "Suspensa", "#F5F5F5")
+
     def __init__(self, title: str, unit: str = "°C", max_value: int = 100):
         super().__init__()
         self.title = title
         self.unit = unit
         self.max_value = max_value
-        self.current_value = 0
+        if unit == "°C":
+            self._bounds, self._styles = self._TEMP_BOUNDS, self._TEMP_STYLES
+        else:
+            self._bounds, self._styles = self._RPM_BOUNDS, self._RPM_STYLES
+        self.current_value = None
+        self._last_bucket = None
         self.setup_ui()
 
     def setup_ui(self):
         self.setFrameStyle(QFrame.Shape.Box)
-        self.setStyleSheet("""
-            QFrame {
-                background: white;
-                border: 2px solid #E0E0E0;
-                border-radius: 12px;
-            }
-        """)
+        self.setProperty("card", True)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
@@ -306,6 +767,7 @@ class ThermalCard(QFrame):
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.value_label = QLabel(f"--{self.unit}")
+        self.value_label.setTextFormat(Qt.TextFormat.PlainText)
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.value_label.setStyleSheet("""
             font-size: 36px;
@@ -332,6 +794,7 @@ class ThermalCard(QFrame):
         """)
 
         self.status_label = QLabel("--")
+        self.status_label.setTextFormat(Qt.TextFormat.PlainText)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setStyleSheet("""
             font-size: 11px;
@@ -347,45 +810,28 @@ class ThermalCard(QFrame):
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.status_label)
 
-    def update_value(self, value: int):
-        self.current_value = value
-        self.value_label.setText(f"{value}{self.unit}")
-        self.progress_bar.setValue(value)
+    def update_value(self, value: Optional[int]):
+        if value == self.current_value and self._last_bucket is not None:
+            return
 
-        color, status, bg = self.get_status_style(value)
-        self.value_label.setStyleSheet(f"""
-            font-size: 36px;
-            font-weight: bold;
-            color: {color};
-            padding: 5px;
-        """)
-        self.status_label.setText(status)
-        self.status_label.setStyleSheet(f"""
-            font-size: 11px;
-            font-weight: 500;
-            color: {color};
-            padding: 3px 8px;
-            background: {bg};
-            border-radius: 8px;
-        """)
+        self.current_value = value
+        if value is None:
+            self.value_label.setText(f"--{self.unit}")
+            self.progress_bar.setValue(0)
+            color, status, bg = self._SUSPENDED_STYLE
+        else:
+            self.value_label.setText(f"{value}{self.unit}")
+            self.progress_bar.setValue(value)
+            color, status, bg = self.get_status_style(value)
+        bucket = (color, status)
+        if bucket != self._last_bucket:
+            self._last_bucket = bucket
+            self.value_label.setStyleSheet(self._VALUE_STYLES[color])
+            self.status_label.setText(status)
+            self.status_label.setStyleSheet(self._STATUS_STYLES[(color, bg)])
 
     def get_status_style(self, value):
-        if self.unit == "°C":
-            if value < 50:
-                return "#4CAF50", "Frio", "#E8F5E9"
-            elif value < 70:
-                return "#FFC107", "Normal", "#FFF8E1"
-            elif value < 85:
-                return "#FF9800", "Quente", "#FFF3E0"
-            else:
-                return "#F44336", "Muito Quente", "#FFEBEE"
-        else:
-            if value < 2000:
-                return "#2196F3", "Baixo", "#E3F2FD"
-            elif value < 4000:
-                return "#4CAF50", "Normal", "#E8F5E9"
-            else:
-                return "#FF9800", "Alto", "#FFF3E0"
+        return self._styles[bisect_right(self._bounds, value)]
 
 
 class FanControlCard(QFrame):
@@ -396,17 +842,23 @@ class FanControlCard(QFrame):
         self.fan_id = fan_id
         self.title = title
         self.manual_enabled = False
+        self._manual_style = None
+        self._last_rpm = None
+        self._pending_boost = 0
+        self._last_emitted = None
+        self._boost_debounce = QTimer(self)
+        self._boost_debounce.setSingleShot(True)
+        self._boost_debounce.setInterval(150)
+        self._boost_debounce.timeout.connect(self._emit_boost)
+        self._label_coalesce = QTimer(self)
+        self._label_coalesce.setSingleShot(True)
+        self._label_coalesce.setInterval(30)
+        self._label_coalesce.timeout.connect(self._flush_boost_label)
         self.setup_ui()
 
     def setup_ui(self):
         self.setFrameStyle(QFrame.Shape.Box)
-        self.setStyleSheet("""
-            QFrame {
-                background: white;
-                border: 2px solid #E0E0E0;
-                border-radius: 12px;
-            }
-        """)
+        self.setProperty("card", True)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
@@ -422,6 +874,15 @@ class FanControlCard(QFrame):
         """)
 
         self.rpm_label = QLabel("0 RPM")
+        self.rpm_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.rpm_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Size for the widest reading using the font the stylesheet resolves to
+        # (12px/500 plus 8px horizontal padding), so fallback fonts don't clip.
+        rpm_font = QFont(self.rpm_label.font())
+        rpm_font.setPixelSize(12)
+        rpm_font.setWeight(QFont.Weight.Medium)
+        rpm_width = QFontMetrics(rpm_font).horizontalAdvance("10,000 RPM")
+        self.rpm_label.setFixedWidth(rpm_width + 2 * 8 + 4)
         self.rpm_label.setStyleSheet("""
             font-size: 12px;
             font-weight: 500;
@@ -436,18 +897,15 @@ class FanControlCard(QFrame):
         header_layout.addWidget(self.rpm_label)
 
         self.manual_toggle = QPushButton("Manual DESLIG.")
+        self.manual_toggle.setObjectName("manualToggle")
         self.manual_toggle.setCheckable(True)
         self.manual_toggle.setFixedHeight(32)
         self.manual_toggle.clicked.connect(self.toggle_manual)
         self.update_manual_button_style(False)
 
         control_widget = QWidget()
-        control_widget.setStyleSheet("""
-            QWidget {
-                background: #F8F9FA;
-                border-radius: 8px;
-            }
-        """)
+        control_widget.setObjectName("fanControls")
+        control_widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         control_layout = QVBoxLayout(control_widget)
         control_layout.setContentsMargins(12, 12, 12, 12)
         control_layout.setSpacing(8)
@@ -481,10 +939,10 @@ class FanControlCard(QFrame):
                 border: 2px solid #CCCCCC;
             }
         """)
-        self.boost_slider.valueChanged.connect(self.update_boost_label)
-        self.boost_slider.sliderReleased.connect(self.apply_boost)
+        self.boost_slider.valueChanged.connect(self._on_slider_value)
 
         self.boost_label = QLabel("0%")
+        self.boost_label.setTextFormat(Qt.TextFormat.PlainText)
         self.boost_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.boost_label.setFixedWidth(50)
         self.boost_label.setStyleSheet("""
@@ -505,23 +963,10 @@ class FanControlCard(QFrame):
 
         for value in [0, 25, 50, 75, 100]:
             btn = QPushButton(f"{value}%")
+            btn.setObjectName("preset")
             btn.setFixedHeight(26)
-            btn.clicked.connect(lambda checked, v=value: self.set_preset(v))
-            btn.setStyleSheet("""
-                QPushButton {
-                    font-size: 11px;
-                    font-weight: 500;
-                    background: white;
-                    color: #666666;
-                    border: 1px solid #E0E0E0;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background: #2196F3;
-                    color: white;
-                    border: 1px solid #2196F3;
-                }
-            """)
+            btn.setProperty("boost", value)
+            btn.clicked.connect(self._on_preset_clicked)
             preset_layout.addWidget(btn)
 
         control_layout.addLayout(slider_layout)
@@ -532,36 +977,11 @@ class FanControlCard(QFrame):
         layout.addWidget(control_widget)
 
     def update_manual_button_style(self, enabled):
-        if enabled:
-            self.manual_toggle.setStyleSheet("""
-                QPushButton {
-                    font-size: 12px;
-                    font-weight: 600;
-                    background: #2196F3;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                }
-                QPushButton:hover {
-                    background: #1976D2;
-                }
-            """)
-        else:
-            self.manual_toggle.setStyleSheet("""
-                QPushButton {
-                    font-size: 12px;
-                    font-weight: 500;
-                    background: white;
-                    color: #666666;
-                    border: 2px solid #E0E0E0;
-                    border-radius: 6px;
-                }
-                QPushButton:hover {
-                    background: #F5F5F5;
-                    border: 2px solid #2196F3;
-                    color: #2196F3;
-                }
-            """)
+        if enabled == self._manual_style:
+            return
+
+        self._manual_style = enabled
+        set_style_state(self.manual_toggle, "state", "on" if enabled else "off")
 
     def toggle_manual(self):
         self.manual_enabled = self.manual_toggle.isChecked()
@@ -570,28 +990,70 @@ class FanControlCard(QFrame):
         self.boost_slider.setEnabled(self.manual_enabled)
 
         if not self.manual_enabled:
-            self.boost_slider.setValue(0)
-            self.boost_changed.emit(self.fan_id, 0)
+            self._boost_debounce.stop()
+            self._emit(0)
+            self._set_slider_silently(0)
+
+    def _on_slider_value(self, value):
+        self._pending_boost = value
+        if not self._label_coalesce.isActive():
+            self._label_coalesce.start()
+        if self.manual_enabled:
+            self._boost_debounce.start()
 
-    def update_boost_label(self, value):
-        self.boost_label.setText(f"{value}%")
-    
-    def apply_boost(self):
+    def _flush_boost_label(self):
+        self.boost_label.setText(f"{self._pending_boost}%")
+
+    def _set_slider_silently(self, boost: int):
+        self.boost_slider.blockSignals(True)
+        self.boost_slider.setValue(boost)
+        self.boost_slider.blockSignals(False)
+        self.boost_label.setText(f"{boost}%")
+        self._last_emitted = boost
+
+    def revert_boost(self, boost: int):
+        self._boost_debounce.stop()
+        self._set_slider_silently(boost)
+
+    def forget_emitted(self):
+        self._last_emitted = None
+
+    def _emit(self, boost: int):
+        if boost == self._last_emitted:
+            return
+
+        self._last_emitted = boost
+        self.boost_changed.emit(self.fan_id, boost)
+
+    def _emit_boost(self):
         if self.manual_enabled:
-            value = self.boost_slider.value()
-            self.boost_changed.emit(self.fan_id, value)
+            self._emit(self._pending_boost)
 
+    @pyqtSlot()
+    def _on_preset_clicked(self):
+        self.set_preset(self.sender().property("boost"))
 
     def set_preset(self, value):
         if self.manual_enabled:
             self.boost_slider.setValue(value)
-            self.boost_changed.emit(self.fan_id, value)
+            self._pending_boost = value
+            self._boost_debounce.start()
 
     def update_rpm(self, rpm: int):
+        if rpm == self._last_rpm:
+            return
+
+        self._last_rpm = rpm
         self.rpm_label.setText(f"{rpm:,} RPM")
 
     def update_boost(self, boost: int):
-        self.boost_slider.setValue(boost)
+        if boost == self.boost_slider.value():
+            return
+
+        if self.boost_slider.isSliderDown() or self._boost_debounce.isActive():
+            return
+
+        self._set_slider_silently(boost)
     
     def sync_manual_state(self, is_manual: bool, boost: int):
         self.manual_enabled = is_manual
@@ -599,8 +1061,7 @@ class FanControlCard(QFrame):
         self.manual_toggle.setText("Manual LIGADO" if is_manual else "Manual DESLIG.")
         self.update_manual_button_style(is_manual)
         self.boost_slider.setEnabled(is_manual)
-        self.boost_slider.setValue(boost)
-        self.boost_label.setText(f"{boost}%")
+        self._set_slider_silently(boost)
 
 
 class GModeButton(QPushButton):
@@ -608,6 +1069,7 @@ class GModeButton(QPushButton):
 
     def __init__(self):
         super().__init__("MODO-G DESLIGADO")
+        self.setObjectName("gModeButton")
         self.setCheckable(True)
         self.setFixedSize(180, 50)
         self.is_on = False
@@ -630,38 +1092,7 @@ class GModeButton(QPushButton):
             self.update_display()
 
     def update_style(self, is_on):
-        if is_on:
-            self.setStyleSheet("""
-                QPushButton {
-                    font-size: 16px;
-                    font-weight: bold;
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #FF4444, stop:1 #CC0000);
-                    color: white;
-                    border: none;
-                    border-radius: 25px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #FF6666, stop:1 #FF0000);
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    font-size: 16px;
-                    font-weight: bold;
-                    background: white;
-                    color: #666666;
-                    border: 3px solid #E0E0E0;
-                    border-radius: 25px;
-                }
-                QPushButton:hover {
-                    background: #F5F5F5;
-                    border: 3px solid #FF4444;
-                    color: #FF4444;
-                }
-            """)
+        set_style_state(self, "state", "on" if is_on else "off")
 
 
 class PowerModeSelector(QFrame):
@@ -670,18 +1101,14 @@ class PowerModeSelector(QFrame):
     def __init__(self):
         super().__init__()
         self.mode_buttons = {}
+        self.button_selected = {}
         self.current_mode = PowerMode.BALANCED
+        self._shown_mode = None
         self.setup_ui()
 
     def setup_ui(self):
         self.setFrameStyle(QFrame.Shape.Box)
-        self.setStyleSheet("""
-            QFrame {
-                background: white;
-                border: 2px solid #E0E0E0;
-                border-radius: 12px;
-            }
-        """)
+        self.setProperty("card", True)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -697,63 +1124,64 @@ class PowerModeSelector(QFrame):
         layout.addWidget(title)
 
         for mode in PowerMode:
-            btn = QPushButton(f"  {mode.value[0]}")
+            btn = QPushButton(f"  {mode.label}")
+            btn.setObjectName("modeButton")
+            btn.setProperty("mode", mode.name)
             btn.setCheckable(True)
             btn.setFixedHeight(38)
-            btn.clicked.connect(lambda checked, m=mode: self.select_mode(m))
+            btn.clicked.connect(self._on_mode_clicked)
             self.mode_buttons[mode] = btn
             self.update_button_style(btn, mode, False)
             layout.addWidget(btn)
 
     def update_button_style(self, btn, mode, selected):
-        color = mode.value[2]
-        if selected:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    font-size: 13px;
-                    font-weight: 600;
-                    text-align: left;
-                    padding-left: 15px;
-                    background: {color};
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                }}
-            """)
-        else:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    font-size: 13px;
-                    font-weight: 500;
-                    text-align: left;
-                    padding-left: 15px;
-                    background: white;
-                    color: #666666;
-                    border: 2px solid #E0E0E0;
-                    border-radius: 6px;
-                }}
-                QPushButton:hover {{
-                    background: #F5F5F5;
-                    color: {color};
-                    border: 2px solid {color};
-                }}
-            """)
+        if self.button_selected.get(mode) == selected:
+            return
+
+        self.button_selected[mode] = selected
+        set_style_state(btn, "selected", selected)
+
+    @pyqtSlot()
+    def _on_mode_clicked(self):
+        self.select_mode(PowerMode[self.sender().property("mode")])
 
     def select_mode(self, mode: PowerMode):
+        if mode == self._shown_mode:
+            # Clicking the active (checkable) button unchecks it; put it back.
+            self.mode_buttons[mode].setChecked(True)
+            return
+
+        self._show_mode(mode)
+        self.mode_changed.emit(mode)
+
+    def set_mode(self, mode: PowerMode):
+        if mode == self._shown_mode:
+            return
+
+        if mode in self.mode_buttons:
+            self._show_mode(mode)
+
+    def _show_mode(self, mode: PowerMode):
         self.current_mode = mode
+        self._shown_mode = mode
         for m, btn in self.mode_buttons.items():
             selected = (m == mode)
             btn.setChecked(selected)
             self.update_button_style(btn, m, selected)
-        self.mode_changed.emit(mode)
 
-    def set_mode(self, mode: PowerMode):
-        if mode in self.mode_buttons:
-            for m, btn in self.mode_buttons.items():
-                selected = (m == mode)
-                btn.setChecked(selected)
-                self.update_button_style(btn, m, selected)
-            self.current_mode = mode
+
+_TEMP_STR = tuple(f"{i}°C" for i in range(200))
+_TEMP_ACTION_TMPL = "CPU: {} | GPU: {}"
+_TOOLTIP_TMPL_ACTIVE = "Dell G15 Control Center\nModo-G: ATIVO\nCPU: {} | GPU: {}"
+_TOOLTIP_TMPL_INACTIVE = "Dell G15 Control Center\nModo-G: INATIVO\nCPU: {} | GPU: {}"
+
+
+def _temp_str(value: Optional[int]) -> str:
+    if value is None:
+        return "--°C"
+    if 0 <= value < len(_TEMP_STR):
+        return _TEMP_STR[value]
+    return f"{value}°C"
 
 
 class SystemTrayIcon(QSystemTrayIcon):
@@ -763,24 +1191,32 @@ class SystemTrayIcon(QSystemTrayIcon):
 
     def __init__(self):
         super().__init__()
-        self.g_mode_active = False
-        self.cpu_temp = 0
-        self.gpu_temp = 0
-        self.create_icon()
+        self.g_mode_active = None
+        self.cpu_temp = None
+        self.gpu_temp = None
+        self._last_tooltip = None
+        self._pending_status = None
+        self._status_throttle = QTimer(self)
+        self._status_throttle.setSingleShot(True)
+        self._status_throttle.setInterval(1000)
+        self._status_throttle.timeout.connect(self._flush_status)
+        self._icon_off = self._render_icon(False)
+        self._icon_on = self._render_icon(True)
+        self.setIcon(self._icon_off)
         self.create_menu()
 
-    def create_icon(self):
+    def _render_icon(self, g_mode: bool) -> QIcon:
         size = 64
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
+        image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
 
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         center = size // 2
         radius = 20
 
-        if self.g_mode_active:
+        if g_mode:
             gradient = QRadialGradient(center, center, radius)
             gradient.setColorAt(0, QColor("#FF6666"))
             gradient.setColorAt(1, QColor("#CC0000"))
@@ -795,10 +1231,10 @@ class SystemTrayIcon(QSystemTrayIcon):
         painter.drawEllipse(center - radius, center - radius, radius * 2, radius * 2)
 
         painter.setPen(QPen(Qt.GlobalColor.white, 2))
-        painter.setFont(QFont("Arial", 14 if self.g_mode_active else 11, QFont.Weight.Bold))
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "G" if self.g_mode_active else "FAN")
+        painter.setFont(QFont("Arial", 14 if g_mode else 11, QFont.Weight.Bold))
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, "G" if g_mode else "FAN")
 
-        if self.g_mode_active:
+        if g_mode:
             painter.setBrush(Qt.GlobalColor.white)
             painter.setPen(Qt.PenStyle.NoPen)
             dot_size = 6
@@ -810,13 +1246,13 @@ class SystemTrayIcon(QSystemTrayIcon):
                 painter.drawEllipse(x, y, dot_size, dot_size)
 
         painter.end()
-        self.setIcon(QIcon(pixmap))
+        return QIcon(QPixmap.fromImage(image))
 
     def create_menu(self):
         menu = QMenu()
 
         self.g_mode_action = QAction("Alternar Modo-G", self)
-        self.g_mode_action.triggered.connect(self.toggle_g_mode.emit)
+        self.g_mode_action.triggered.connect(self.toggle_g_mode)
         menu.addAction(self.g_mode_action)
 
         menu.addSeparator()
@@ -828,34 +1264,70 @@ class SystemTrayIcon(QSystemTrayIcon):
         menu.addSeparator()
 
         show_action = QAction("Mostrar Janela", self)
-        show_action.triggered.connect(self.show_window.emit)
+        show_action.triggered.connect(self.show_window)
         menu.addAction(show_action)
 
         quit_action = QAction("Sair", self)
-        quit_action.triggered.connect(self.quit_app.emit)
+        quit_action.triggered.connect(self.quit_app)
         menu.addAction(quit_action)
 
         self.setContextMenu(menu)
 
     def update_status(self, g_mode: bool, cpu_temp: int, gpu_temp: int):
-        self.g_mode_active = g_mode
-        self.cpu_temp = cpu_temp
-        self.gpu_temp = gpu_temp
+        if self._status_throttle.isActive():
+            self._pending_status = (g_mode, cpu_temp, gpu_temp)
+            return
+
+        self._apply_status(g_mode, cpu_temp, gpu_temp)
+        self._status_throttle.start()
+
+    def _flush_status(self):
+        if self._pending_status is not None:
+            pending, self._pending_status = self._pending_status, None
+            self._apply_status(*pending)
+            self._status_throttle.start()
+
+    def _apply_status(self, g_mode: bool, cpu_temp: int, gpu_temp: int):
+        g_mode_changed = g_mode != self.g_mode_active
+        temps_changed = (cpu_temp, gpu_temp) != (self.cpu_temp, self.gpu_temp)
+        if not g_mode_changed and not temps_changed:
+            return
+
+        if g_mode_changed:
+            self.g_mode_active = g_mode
+            self.setIcon(self._icon_on if g_mode else self._icon_off)
+            self.g_mode_action.setText(f"Desabilitar Modo-G" if g_mode else "Habilitar Modo-G")
+
+        cpu_str = _temp_str(cpu_temp)
+        gpu_str = _temp_str(gpu_temp)
+        if temps_changed:
+            self.cpu_temp = cpu_temp
+            self.gpu_temp = gpu_temp
+            self.temp_action.setText(_TEMP_ACTION_TMPL.format(cpu_str, gpu_str))
 
-        self.create_icon()
+        tooltip = (_TOOLTIP_TMPL_ACTIVE if g_mode else _TOOLTIP_TMPL_INACTIVE).format(cpu_str, gpu_str)
+        if tooltip != self._last_tooltip:
+            self._last_tooltip = tooltip
+            self.setToolTip(tooltip)
 
-        status = "ATIVO" if g_mode else "INATIVO"
-        self.setToolTip(f"Dell G15 Control Center\nModo-G: {status}\nCPU: {cpu_temp}°C | GPU: {gpu_temp}°C")
 
-        self.temp_action.setText(f"CPU: {cpu_temp}°C | GPU: {gpu_temp}°C")
-        self.g_mode_action.setText(f"Desabilitar Modo-G" if g_mode else "Habilitar Modo-G")
+class _NullTray:
+    def update_status(self, g_mode: bool, cpu_temp: int, gpu_temp: int):
+        pass
+
+    def showMessage(self, *args):
+        pass
+
+    def isVisible(self) -> bool:
+        return False
 
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
-        QApplication.setStyle('Fusion')
+        self.tray = _NullTray()
+        self.monitor = None
 
         self.daemon_client = G15DaemonClient()
         if not self.daemon_client.daemon_available:
@@ -867,6 +1339,9 @@ class MainWindow(QMainWindow):
         self.autostart_manager = AutoStartManager()
         self.mode_changing = False
         self.initial_sync_done = False
+        self._last_sensor_data = None
+        self._last_g_mode = None
+        self._last_mode_warn_ts = 0.0
 
         self.setup_ui()
         self.setup_monitoring()
@@ -885,30 +1360,7 @@ class MainWindow(QMainWindow):
         msg.setStandardButtons(QMessageBox.StandardButton.Ok)
         msg.setDefaultButton(QMessageBox.StandardButton.Ok)
         
-        msg.setStyleSheet("""
-            QMessageBox {
-                background: #F5F6FA;
-                font-family: "Segoe UI", Arial, sans-serif;
-            }
-            QMessageBox QLabel {
-                color: #2C3E50;
-                font-size: 12px;
-                padding: 15px;
-            }
-            QMessageBox QPushButton {
-                background: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 24px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QMessageBox QPushButton:hover {
-                background: #1976D2;
-            }
-        """)
+        msg.setStyleSheet(DAEMON_DIALOG_STYLE)
         
         msg.exec()
         app.quit()
@@ -917,11 +1369,7 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Dell G15 Control Center")
         self.setFixedSize(1000, 600)
 
-        self.setStyleSheet("""
-            QMainWindow {
-                background: #F5F6FA;
-            }
-        """)
+        self.setStyleSheet(MAIN_WINDOW_STYLE)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -933,21 +1381,11 @@ class MainWindow(QMainWindow):
         header_layout.setSpacing(15)
 
         title = QLabel("Dell G15 Control Center")
-        title.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: #2C3E50;
-        """)
+        title.setStyleSheet(HEADER_TITLE_STYLE)
+        title.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
-        model_label = QLabel("Modelo: Dell G15 (via daemon)")
-        model_label.setStyleSheet("""
-            font-size: 12px;
-            color: #666666;
-            padding: 4px 10px;
-            background: white;
-            border: 1px solid #E0E0E0;
-            border-radius: 12px;
-        """)
+        model_label = QLabel(self.daemon_client.model_display)
+        model_label.setStyleSheet(MODEL_LABEL_STYLE)
 
         self.g_mode_button = GModeButton()
         self.g_mode_button.toggled_signal.connect(self.toggle_g_mode)
@@ -958,32 +1396,14 @@ class MainWindow(QMainWindow):
         header_layout.addWidget(self.g_mode_button)
 
         tabs = QTabWidget()
-        tabs.setStyleSheet("""
-            QTabWidget::pane {
-                background: transparent;
-                border: none;
-            }
-            QTabBar::tab {
-                background: white;
-                color: #666666;
-                padding: 8px 16px;
-                margin-right: 4px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-weight: 500;
-            }
-            QTabBar::tab:selected {
-                color: #2C3E50;
-                border-bottom: 2px solid #2196F3;
-            }
-        """)
+        tabs.setStyleSheet(TABS_STYLE)
 
         monitor_tab = QWidget()
         monitor_layout = QVBoxLayout(monitor_tab)
         monitor_layout.setSpacing(15)
 
         thermal_section = QFrame()
-        thermal_section.setStyleSheet("QFrame { background: transparent; }")
+        thermal_section.setStyleSheet(SECTION_STYLE)
         thermal_layout = QHBoxLayout(thermal_section)
         thermal_layout.setSpacing(15)
 
@@ -998,15 +1418,16 @@ class MainWindow(QMainWindow):
         thermal_layout.addWidget(self.fan2_rpm)
 
         fan_section = QFrame()
-        fan_section.setStyleSheet("QFrame { background: transparent; }")
+        fan_section.setStyleSheet(SECTION_STYLE)
         fan_layout = QHBoxLayout(fan_section)
         fan_layout.setSpacing(15)
 
         self.fan1_control = FanControlCard(1, "Controle Ventoinha CPU")
         self.fan2_control = FanControlCard(2, "Controle Ventoinha GPU")
 
-        self.fan1_control.boost_changed.connect(self.on_fan_boost_changed)
-        self.fan2_control.boost_changed.connect(self.on_fan_boost_changed)
+        for fan_control in (self.fan1_control, self.fan2_control):
+            fan_control.boost_changed.connect(self.on_fan_boost_changed,
+                                              Qt.ConnectionType.QueuedConnection)
 
         fan_layout.addWidget(self.fan1_control)
         fan_layout.addWidget(self.fan2_control)
@@ -1023,135 +1444,126 @@ class MainWindow(QMainWindow):
         self.power_selector = PowerModeSelector()
         self.power_selector.mode_changed.connect(self.on_mode_changed)
 
+        settings_layout.addWidget(self.power_selector)
+
+        tabs.addTab(monitor_tab, "Monitor")
+        tabs.addTab(settings_tab, "Configurações")
+
+        # The info panel and autostart checkbox are only needed once the user
+        # opens the Settings tab; the power selector stays eager because the
+        # sensor tick keeps it in sync.
+        self._settings_tab = settings_tab
+        self._settings_layout = settings_layout
+        self._tabs = tabs
+        tabs.currentChanged.connect(self._maybe_build_settings)
+
+        main_layout.addLayout(header_layout)
+        main_layout.addWidget(tabs)
+
+    def _maybe_build_settings(self, index):
+        if self._tabs.widget(index) is not self._settings_tab:
+            return
+        self._tabs.currentChanged.disconnect(self._maybe_build_settings)
+
         info_panel = QFrame()
-        info_panel.setStyleSheet("""
-            QFrame {
-                background: white;
-                border: 2px solid #E0E0E0;
-                border-radius: 12px;
-                padding: 15px;
-            }
-        """)
+        info_panel.setStyleSheet(INFO_PANEL_STYLE)
         info_layout = QVBoxLayout(info_panel)
 
-        info_text = QLabel("""
-<b>Instruções:</b><br><br>
-• <b>Modo-G:</b> Ativa resfriamento máximo<br>
-• <b>Modos de Energia:</b> Escolha seu perfil térmico<br>
-• <b>Controle Manual:</b> Selecione modo Personalizado primeiro<br>
-• <b>Bandeja do Sistema:</b> Duplo-clique para mostrar/ocultar<br><br>
-<b>Hardware:</b> Controlador Dell G15""")
-
-        info_text.setStyleSheet("""
-            font-size: 12px;
-            color: #666666;
-            line-height: 1.5;
-        """)
+        info_text = QLabel(INFO_TEXT)
+        info_text.setTextFormat(Qt.TextFormat.RichText)
+        info_text.setStyleSheet(INFO_TEXT_STYLE)
         info_text.setWordWrap(True)
 
         self.autostart_checkbox = QCheckBox("Inicializar com o sistema")
-        self.autostart_checkbox.setChecked(self.autostart_manager.is_enabled())
+        self.autostart_checkbox.setEnabled(False)
         self.autostart_checkbox.toggled.connect(self.on_autostart_toggled)
-        self.autostart_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 13px;
-                font-weight: 500;
-                color: #333333;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #CCCCCC;
-                border-radius: 3px;
-                background: white;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #2196F3;
-                border-radius: 3px;
-                background: #2196F3;
-                image: url(data:image/svg+xml,%3csvg viewBox='0 0 16 16' fill='white' xmlns='http://www.w3.org/2000/svg'%3e%3cpath d='m13.854 3.646-7.5 7.5a.5.5 0 0 1-.708 0l-3.5-3.5a.5.5 0 1 1 .708-.708L6 10.293l7.146-7.147a.5.5 0 0 1 .708.708z'/%3e%3c/svg%3e);
-            }
-        """)
+        self.autostart_checkbox.setStyleSheet(AUTOSTART_CHECKBOX_STYLE)
+
+        self._autostart_probe = _AutostartProbe(self.autostart_manager)
+        self._autostart_probe.signals.done.connect(self._on_autostart_probed)
+        QThreadPool.globalInstance().start(self._autostart_probe)
 
         info_layout.addWidget(info_text)
         info_layout.addWidget(self.autostart_checkbox)
         info_layout.addStretch()
 
-        settings_layout.addWidget(self.power_selector)
-        settings_layout.addWidget(info_panel, 1)
-
-        tabs.addTab(monitor_tab, "Monitor")
-        tabs.addTab(settings_tab, "Configurações")
+        self._settings_layout.addWidget(info_panel, 1)
 
-        main_layout.addLayout(header_layout)
-        main_layout.addWidget(tabs)
+    @pyqtSlot(bool)
+    def _on_autostart_probed(self, enabled):
+        self.autostart_checkbox.blockSignals(True)
+        self.autostart_checkbox.setChecked(enabled)
+        self.autostart_checkbox.blockSignals(False)
+        self.autostart_checkbox.setEnabled(True)
+        self._autostart_probe = None
 
     def setup_monitoring(self):
-        self.monitor = SensorMonitor(self.daemon_client)
-        self.monitor.data_updated.connect(self.update_sensor_data)
+        self.monitor = SensorMonitor(self.daemon_client, self)
+        self.monitor.data_updated.connect(self.update_sensor_data,
+                                          Qt.ConnectionType.DirectConnection)
         self.monitor.start()
 
     def setup_tray(self):
         if QSystemTrayIcon.isSystemTrayAvailable():
             self.tray = SystemTrayIcon()
-            self.tray.toggle_g_mode.connect(self.toggle_g_mode)
-            self.tray.show_window.connect(self.show_and_raise)
-            self.tray.quit_app.connect(self.quit_application)
-            self.tray.activated.connect(self.on_tray_activated)
+            direct = Qt.ConnectionType.DirectConnection
+            self.tray.toggle_g_mode.connect(self.toggle_g_mode, direct)
+            self.tray.show_window.connect(self.show_and_raise, direct)
+            self.tray.quit_app.connect(self.quit_application, direct)
+            self.tray.activated.connect(self.on_tray_activated, direct)
             self.tray.show()
 
 
-    def update_sensor_data(self, data):
-        self.cpu_thermal.update_value(data['cpu_temp'])
-        self.gpu_thermal.update_value(data['gpu_temp'])
-        self.fan1_rpm.update_value(data['fan1_rpm'])
-        self.fan2_rpm.update_value(data['fan2_rpm'])
+    def update_sensor_data(self, data: SensorData):
+        if data == self._last_sensor_data:
+            return
+        if not self.mode_changing:
+            self._last_sensor_data = data
 
-        self.fan1_control.update_rpm(data['fan1_rpm'])
-        self.fan2_control.update_rpm(data['fan2_rpm'])
-        
-        g_mode_active = data['g_mode']
-        
-        self.power_selector.setEnabled(not g_mode_active)
-        self.fan1_control.setEnabled(not g_mode_active)
-        self.fan2_control.setEnabled(not g_mode_active)
+        self.cpu_thermal.update_value(data.cpu_temp)
+        self.gpu_thermal.update_value(data.gpu_temp)
+        self.fan1_rpm.update_value(data.fan1_rpm)
+        self.fan2_rpm.update_value(data.fan2_rpm)
+
+        self.fan1_control.update_rpm(data.fan1_rpm)
+        self.fan2_control.update_rpm(data.fan2_rpm)
         
+        if data.g_mode != self._last_g_mode:
+            self._last_g_mode = data.g_mode
+            self.power_selector.setEnabled(not data.g_mode)
+            self.fan1_control.setEnabled(not data.g_mode)
+            self.fan2_control.setEnabled(not data.g_mode)
+
+        # GModeButton flips itself optimistically on click; always re-sync it so a
+        # failed toggle is reverted (set_state is a no-op when already equal).
+        self.g_mode_button.set_state(data.g_mode)
+
         if not self.initial_sync_done:
-            if data['power_mode'] == PowerMode.CUSTOM:
-                self.fan1_control.sync_manual_state(
-                    data.get('fan1_manual', False),
-                    data['fan1_boost']
-                )
-                self.fan2_control.sync_manual_state(
-                    data.get('fan2_manual', False),
-                    data['fan2_boost']
-                )
+            if data.power_mode == PowerMode.CUSTOM:
+                self.fan1_control.sync_manual_state(data.fan1_manual, data.fan1_boost)
+                self.fan2_control.sync_manual_state(data.fan2_manual, data.fan2_boost)
             self.initial_sync_done = True
         else:
-            self.fan1_control.update_boost(data['fan1_boost'])
-            self.fan2_control.update_boost(data['fan2_boost'])
+            self.fan1_control.update_boost(data.fan1_boost)
+            self.fan2_control.update_boost(data.fan2_boost)
 
         if not self.mode_changing:
-            self.power_selector.set_mode(data['power_mode'])
-        
-        self.g_mode_button.set_state(data['g_mode'])
+            self.power_selector.set_mode(data.power_mode)
 
-        if hasattr(self, 'tray'):
-            self.tray.update_status(data['g_mode'], data['cpu_temp'], data['gpu_temp'])
+        self.tray.update_status(data.g_mode, data.cpu_temp, data.gpu_temp)
 
     def toggle_g_mode(self, state=None):
         self.daemon_client.toggle_g_mode()
-        self.daemon_client._cached_data = None
-        if hasattr(self, 'monitor'):
+        self.daemon_client.invalidate_cache()
+        # Force the next update through even if the daemon state didn't change.
+        self._last_sensor_data = None
+        if self.monitor is not None:
             self.monitor.update_once()
 
     def on_mode_changed(self, mode: PowerMode):
         self.mode_changing = True
         success = self.daemon_client.set_power_mode(mode)
-        QTimer.singleShot(2000, lambda: setattr(self, 'mode_changing', False))
+        QTimer.singleShot(2000, self._end_mode_change)
 
         if mode == PowerMode.CUSTOM:
             if not self.custom_message_shown:
@@ -1159,28 +1571,38 @@ class MainWindow(QMainWindow):
                 QMessageBox.information(self, "Modo Personalizado",
                     "Modo personalizado ativado.\nHabilite controle Manual nos cartões das ventoinhas.")
         else:
-            self.fan1_control.manual_enabled = False
-            self.fan1_control.manual_toggle.setChecked(False)
-            self.fan1_control.manual_toggle.setText("Manual DESLIG.")
-            self.fan1_control.update_manual_button_style(False)
-            self.fan1_control.boost_slider.setEnabled(False)
-            self.fan1_control.boost_slider.setValue(0)
-            
-            self.fan2_control.manual_enabled = False
-            self.fan2_control.manual_toggle.setChecked(False)
-            self.fan2_control.manual_toggle.setText("Manual DESLIG.")
-            self.fan2_control.update_manual_button_style(False)
-            self.fan2_control.boost_slider.setEnabled(False)
-            self.fan2_control.boost_slider.setValue(0)
+            for fan_control in (self.fan1_control, self.fan2_control):
+                if fan_control.manual_enabled or fan_control.manual_toggle.isChecked():
+                    fan_control.sync_manual_state(False, 0)
 
+    def _end_mode_change(self):
+        self.mode_changing = False
+        self._last_sensor_data = None
+
+    @pyqtSlot(int, int)
     def on_fan_boost_changed(self, fan_id: int, boost: int):
+        fan_control = self.fan1_control if fan_id == 1 else self.fan2_control
         if self.daemon_client.get_power_mode() != PowerMode.CUSTOM:
-            QMessageBox.warning(self, "Aviso de Modo",
-                "Por favor, selecione o modo Personalizado primeiro.")
+            now = time.monotonic()
+            if now - self._last_mode_warn_ts >= 2.0:
+                self._last_mode_warn_ts = now
+                if self.tray.isVisible():
+                    self.tray.showMessage(
+                        "Aviso de Modo",
+                        "Por favor, selecione o modo Personalizado primeiro.",
+                        QSystemTrayIcon.MessageIcon.Warning,
+                        2000
+                    )
+                else:
+                    QMessageBox.warning(self, "Aviso de Modo",
+                        "Por favor, selecione o modo Personalizado primeiro.")
+            fan_control.revert_boost(self.daemon_client.get_fan_boost(fan_id))
             return
 
-        self.daemon_client.set_fan_boost(fan_id, boost)
-        self.daemon_client._cached_data = None
+        if not self.daemon_client.set_fan_boost(fan_id, boost):
+            # Let the same value be sent again instead of being deduplicated.
+            fan_control.forget_emitted()
+        self.daemon_client.invalidate_cache()
 
     def on_autostart_toggled(self, enabled: bool):
         try:
@@ -1211,70 +1633,82 @@ class MainWindow(QMainWindow):
         self.raise_()
         self.activateWindow()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.monitor is not None:
+            self.monitor.set_active(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.monitor is not None:
+            self.monitor.set_active(False)
+
     def on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self.show_and_raise()
 
     def quit_application(self):
-        if hasattr(self, 'monitor') and self.monitor:
+        if self.monitor is not None:
             self.monitor.stop()
+        self.daemon_client.close()
         QApplication.instance().quit()
 
     def closeEvent(self, event):
-        if hasattr(self, 'tray') and self.tray.isVisible():
+        if self.tray.isVisible():
             self.hide()
-            if hasattr(self, 'tray'):
-                self.tray.showMessage(
-                    "Dell G15 Control Center",
-                    "Minimizado para bandeja do sistema",
-                    QSystemTrayIcon.MessageIcon.Information,
-                    2000
-                )
+            self.tray.showMessage(
+                "Dell G15 Control Center",
+                "Minimizado para bandeja do sistema",
+                QSystemTrayIcon.MessageIcon.Information,
+                2000
+            )
             event.ignore()
         else:
-            if hasattr(self, 'monitor') and self.monitor:
+            if self.monitor is not None:
                 self.monitor.stop()
             event.accept()
     
     def sync_initial_state(self):
         try:
-            data = self.daemon_client._get_all_data()
-            power_mode = self.daemon_client.get_power_mode()
-            
-            if power_mode == PowerMode.CUSTOM:
-                fans_data = data.get('fans', {})
-                
-                if fans_data.get('fan1_manual', False):
-                    self.fan1_control.sync_manual_state(
-                        True,
-                        fans_data.get('fan1_boost', 0)
-                    )
-                
-                if fans_data.get('fan2_manual', False):
-                    self.fan2_control.sync_manual_state(
-                        True,
-                        fans_data.get('fan2_boost', 0)
-                    )
-                    
-            self.power_selector.set_mode(power_mode)
-            self.g_mode_button.set_state(data.get('power', {}).get('g_mode', False))
-            
+            data = self.daemon_client.get_snapshot()
+
+            if data.power_mode == PowerMode.CUSTOM:
+                if data.fan1_manual:
+                    self.fan1_control.sync_manual_state(True, data.fan1_boost)
+
+                if data.fan2_manual:
+                    self.fan2_control.sync_manual_state(True, data.fan2_boost)
+
+            self.power_selector.set_mode(data.power_mode)
+            self.g_mode_button.set_state(data.g_mode)
+
         except Exception as e:
             pass
 
 
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Dell G15 Control Center")
+    parser.add_argument('--debug', action='store_true', help="log sensor polling to stderr")
+    args, qt_args = parser.parse_known_args()
+
+    if args.debug:
+        _log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        _log_handler.setLevel(logging.DEBUG)
+        log.setLevel(logging.DEBUG)
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setQuitOnLastWindowClosed(False)
 
     app.setStyle('Fusion')
+    QDir.addSearchPath('g15', str(ASSETS_DIR))
+    app.setStyleSheet(APP_STYLE + MODE_BUTTON_STYLE)
 
     font = QFont("Segoe UI", 10)
     app.setFont(font)
 
     window = MainWindow()
     
-    if not hasattr(window, 'daemon_client') or not window.daemon_client.daemon_available:
+    if not window.daemon_client.daemon_available:
         return
     
     window.show()
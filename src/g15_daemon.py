@@ -14,12 +14,33 @@ import tempfile
 import shutil
 import select
 import struct
+import functools
 from pathlib import Path
 from enum import Enum
 from typing import Dict, Any, Optional
 from datetime import datetime
 import secrets
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+MAX_MESSAGE_SIZE = 64 * 1024
+FRAME_HEADER = struct.Struct('>I')
+HWMON_CACHE_VERSION = 1
+
+TEMP_SENSOR_ARGS = {1: ("0x04", "0x01"), 2: ("0x04", "0x02")}
+FAN_SENSOR_IDS = {1: "0x32", 2: "0x33"}
+BOOST_HEX = tuple(f"0x{percentage:02X}" for percentage in range(101))
+
+
+@functools.lru_cache(maxsize=64)
+def _format_acpi_command(acpi_base: str, wmi_code: str, args: tuple) -> bytes:
+    padded = args + ("0x00",) * (4 - len(args))
+    return f"{acpi_base} 0 {wmi_code} {{{', '.join(padded)}}}".encode('ascii')
+
 
 class PowerMode(Enum):
     QUIET = ("Silencioso", "0xa3", "#4CAF50")
@@ -27,6 +48,21 @@ class PowerMode(Enum):
     PERFORMANCE = ("Performance", "0xa1", "#FF9800")
     CUSTOM = ("Personalizado", "0xa2", "#9C27B0")
 
+    @property
+    def label(self) -> str:
+        return self.value[0]
+
+    @property
+    def code(self) -> str:
+        return self.value[1]
+
+    @property
+    def color(self) -> str:
+        return self.value[2]
+
+
+MODE_BY_NAME = {mode.label: mode for mode in PowerMode}
+
 
 class GModeKeyListener:
     
@@ -40,10 +76,8 @@ class GModeKeyListener:
         
     def find_keyboard_device(self):
         try:
-            devices_info = subprocess.run(
-                ['cat', '/proc/bus/input/devices'], 
-                capture_output=True, text=True, check=True
-            ).stdout
+            with open('/proc/bus/input/devices', 'r') as f:
+                devices_info = f.read()
             
             lines = devices_info.split('\n')
             current_device = {}
@@ -241,6 +275,9 @@ class G15HardwareController:
     def __init__(self):
         self.acpi_call_path = "/proc/acpi/call"
         self.acpi_base = r"\_SB.AMWW.WMAX"
+        self.cache_dir = Path('/var/cache/g15-daemon')
+        self.model_cache_file = self.cache_dir / 'model'
+        self.hwmon_cache_file = self.cache_dir / 'hwmon.json'
         self.current_mode = PowerMode.BALANCED
         self.g_mode_active = False
         self.manual_mode = False
@@ -251,13 +288,39 @@ class G15HardwareController:
         self.hwmon_path = None
         self.hwmon_fans = {}
         self.hwmon_temps = {}
+        self._cpu_temp_path = None
+        self._gpu_temp_path = None
+        self._fan_paths = {1: None, 2: None}
+        self._cpu_temp_fd = None
+        self._gpu_temp_fd = None
+        self._gpu_pm_fd = None
+        self._fan_fds = {1: None, 2: None}
+
+        self._acpi_fd = None
+        self._acpi_lock = threading.RLock()
+        self._cache = {}
+        self._cache_ttl = 0.8
+        self._slow_read_ns = 50_000_000
+        self._slow_backoff_scans = 10
+        self._slow_sensors = {}
+        self._last_written = {}
+        self._write_dedupe_window = 1.0
 
         self.logger = logging.getLogger('g15.hardware')
         self.config_manager = ConfigManager()
 
+        self._cmd_cpu_temp = self._build_acpi_command("0x14", list(TEMP_SENSOR_ARGS[1]))
+        self._cmd_gpu_temp = self._build_acpi_command("0x14", list(TEMP_SENSOR_ARGS[2]))
+        self._cmd_fan_rpm = {
+            fan_id: self._build_acpi_command("0x14", ["0x05", sensor_id])
+            for fan_id, sensor_id in FAN_SENSOR_IDS.items()
+        }
+        self._cmd_g_mode_status = self._build_acpi_command("0x25", ["0x02"])
+
         self._validate_security()
         self._check_acpi_availability()
         self._detect_hwmon_sensors()
+        self._detect_gpu_device()
         self._detect_model()
         self._load_and_apply_config()
 
@@ -279,10 +342,9 @@ class G15HardwareController:
             sys.exit(1)
 
         try:
-            result = subprocess.run(['lsmod'], capture_output=True, text=True)
-            if 'acpi_call' not in result.stdout:
+            if not self._module_loaded('acpi_call'):
                 self.logger.info("Loading acpi_call module...")
-                result = subprocess.run(['modprobe', 'acpi_call'], capture_output=True, text=True)
+                result = subprocess.run(['modprobe', 'acpi_call'], capture_output=True, text=True, check=False)
                 if result.returncode != 0:
                     self.logger.error("Failed to load acpi_call module.")
                     sys.exit(1)
@@ -291,14 +353,24 @@ class G15HardwareController:
             sys.exit(1)
 
         try:
-            with open(self.acpi_call_path, 'w') as f:
-                f.write("test")
+            os.write(self._open_acpi_fd(), b"test")
             self.logger.info("ACPI interface is accessible")
         except Exception as e:
             self.logger.error(f"Cannot write to ACPI interface: {e}")
             sys.exit(1)
 
+    def _module_loaded(self, name: str) -> bool:
+        try:
+            with open('/proc/modules', 'r') as f:
+                return any(line.startswith(name + ' ') for line in f)
+        except OSError:
+            return False
+
     def _detect_hwmon_sensors(self):
+        if self._load_hwmon_cache():
+            self._open_hwmon_sensors()
+            return
+
         dell_hwmon_names = ['dell_smm', 'dell_ddv']
 
         for hwmon_dir in glob.glob('/sys/class/hwmon/hwmon*'):
@@ -320,6 +392,9 @@ class G15HardwareController:
                             fan_num = fan_file.split('fan')[1].split('_')[0]
                             self.hwmon_fans[int(fan_num)] = fan_file
 
+                        self._open_hwmon_sensors()
+                        self._save_hwmon_cache(hwmon_name)
+
                         self.logger.info(f"Detected temperatures: {list(self.hwmon_temps.keys())}")
                         self.logger.info(f"Detected fans: {list(self.hwmon_fans.keys())}")
                         return
@@ -329,14 +404,107 @@ class G15HardwareController:
 
         self.logger.warning("No Dell hwmon sensors found, using ACPI only")
 
+    def _open_hwmon_sensors(self):
+        self._cpu_temp_path = self.hwmon_temps.get(1)
+        self._gpu_temp_path = self.hwmon_temps.get(2)
+        self._fan_paths = {fid: self.hwmon_fans.get(fid) for fid in (1, 2)}
+        self._open_hwmon_fds()
+
+    def _open_hwmon_fds(self):
+        self._cpu_temp_fd = self._open_hwmon_fd(self._cpu_temp_path)
+        self._gpu_temp_fd = self._open_hwmon_fd(self._gpu_temp_path)
+        self._fan_fds = {fid: self._open_hwmon_fd(path) for fid, path in self._fan_paths.items()}
+
+    def _load_hwmon_cache(self) -> bool:
+        # hwmonN numbering can change between boots, so the cached entry is only
+        # trusted if the directory still carries the same driver name.
+        try:
+            cached = json.loads(self.hwmon_cache_file.read_text())
+            if cached.get('version') != HWMON_CACHE_VERSION:
+                return False
+
+            hwmon_path = cached['hwmon_path']
+            if not hwmon_path.startswith('/sys/class/hwmon/hwmon'):
+                return False
+
+            with open(os.path.join(hwmon_path, 'name'), 'r') as f:
+                if f.read().strip() != cached['name']:
+                    return False
+
+            temps = {int(num): path for num, path in cached['temps'].items()}
+            fans = {int(num): path for num, path in cached['fans'].items()}
+            for path in list(temps.values()) + list(fans.values()):
+                if not path.startswith(hwmon_path + '/') or not os.path.exists(path):
+                    return False
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+
+        self.hwmon_path = hwmon_path
+        self.hwmon_temps = temps
+        self.hwmon_fans = fans
+        self.logger.info(f"Using cached Dell hwmon: {cached['name']} at {hwmon_path}")
+        return True
+
+    def _save_hwmon_cache(self, hwmon_name: str):
+        cache = {
+            'version': HWMON_CACHE_VERSION,
+            'name': hwmon_name,
+            'hwmon_path': self.hwmon_path,
+            'temps': {str(num): path for num, path in self.hwmon_temps.items()},
+            'fans': {str(num): path for num, path in self.hwmon_fans.items()}
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.hwmon_cache_file.write_text(json.dumps(cache))
+        except OSError as e:
+            self.logger.warning(f"Failed to cache hwmon sensors: {e}")
+
+    def _detect_gpu_device(self):
+        for device_dir in sorted(glob.glob('/sys/bus/pci/drivers/nvidia/0000:*')):
+            for pm_file in ('power/runtime_status', 'power_state'):
+                pm_path = os.path.join(device_dir, pm_file)
+                if not os.path.exists(pm_path):
+                    continue
+
+                try:
+                    self._gpu_pm_fd = os.open(pm_path, os.O_RDONLY)
+                except OSError as e:
+                    self.logger.warning(f"Cannot open dGPU power state {pm_path}: {e}")
+                    continue
+
+                self.logger.info(f"Found dGPU power state at {pm_path}")
+                return
+
+        self.logger.info("No dGPU power state found, GPU sensor always polled")
+
+    def _gpu_suspended(self) -> bool:
+        if self._gpu_pm_fd is None:
+            return False
+
+        try:
+            state = os.pread(self._gpu_pm_fd, 16, 0)
+        except OSError:
+            return False
+        return state.startswith(b'suspended') or state.startswith(b'D3cold')
+
     def _detect_model(self):
+        model_map = {
+            "0x1": "5511", "0x2": "5515", "0x3": "5520",
+            "0x4": "5525", "0x5": "5530", "0x6": "5535"
+        }
+
+        try:
+            cached_model = self.model_cache_file.read_text().strip()
+            if cached_model in model_map.values():
+                self.model = cached_model
+                self.logger.info(f"Using cached Dell G15 model {self.model}")
+                return
+        except OSError:
+            pass
+
         try:
             result = self._acpi_call_real("0x1a", ["0x02", "0x02"])
             if result and result != "0x0":
-                model_map = {
-                    "0x1": "5511", "0x2": "5515", "0x3": "5520",
-                    "0x4": "5525", "0x5": "5530", "0x6": "5535"
-                }
                 self.model = model_map.get(result, "Unknown")
                 self.logger.info(f"Detected Dell G15 {self.model}")
             else:
@@ -344,6 +512,13 @@ class G15HardwareController:
         except Exception as e:
             self.logger.warning(f"Model detection failed: {e}")
             self.model = "Unknown"
+
+        if self.model != "Unknown":
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self.model_cache_file.write_text(self.model)
+            except OSError as e:
+                self.logger.warning(f"Failed to cache model: {e}")
     
     def _load_and_apply_config(self):
         try:
@@ -356,10 +531,9 @@ class G15HardwareController:
             self.logger.info("Applying saved configuration...")
             
             mode_name = config.get('power_mode', 'Balanceado')
-            for mode in PowerMode:
-                if mode.value[0] == mode_name:
-                    self.set_power_mode(mode, save_config=False)
-                    break
+            mode = MODE_BY_NAME.get(mode_name)
+            if mode is not None:
+                self.set_power_mode(mode, save_config=False)
             
             g_mode = config.get('g_mode', False)
             if g_mode:
@@ -384,7 +558,7 @@ class G15HardwareController:
     def _save_current_config(self):
         try:
             config = {
-                'power_mode': self.current_mode.value[0],
+                'power_mode': self.current_mode.label,
                 'g_mode': self.g_mode_active,
                 'fan_profiles': {
                     'cpu_fan_boost': self.current_fan_boosts.get(1, 0),
@@ -401,108 +575,252 @@ class G15HardwareController:
         except Exception as e:
             self.logger.error(f"Config save failed: {e}")
 
-    def _read_hwmon_sensor(self, sensor_path: str) -> int:
+    def _open_hwmon_fd(self, sensor_path: Optional[str]) -> Optional[int]:
+        if not sensor_path:
+            return None
+
+        if not sensor_path.startswith('/sys/class/hwmon/'):
+            self.logger.error(f"SECURITY: Invalid sensor path: {sensor_path}")
+            return None
+
         try:
-            if not sensor_path.startswith('/sys/class/hwmon/'):
-                self.logger.error(f"SECURITY: Invalid sensor path: {sensor_path}")
-                return 0
+            return os.open(sensor_path, os.O_RDONLY)
+        except OSError as e:
+            self.logger.error(f"Error opening hwmon sensor {sensor_path}: {e}")
+            return None
 
-            with open(sensor_path, 'r') as f:
-                value = int(f.read().strip())
-                return value
-        except Exception as e:
-            self.logger.error(f"Error reading hwmon sensor {sensor_path}: {e}")
+    def _read_hwmon_fd(self, fd: int) -> int:
+        try:
+            return int(os.pread(fd, 16, 0))
+        except OSError as e:
+            # A stale fd (e.g. dell_smm reloaded) fails forever; reopen by path.
+            self.logger.error(f"Error reading hwmon sensor fd {fd}: {e}")
+            self._reopen_hwmon_fds()
+            return 0
+        except ValueError as e:
+            self.logger.error(f"Error reading hwmon sensor fd {fd}: {e}")
             return 0
 
-    def _acpi_call_real(self, wmi_code: str, args: list = None) -> str:
+    def _reopen_hwmon_fds(self):
+        with self._acpi_lock:
+            for fd in (self._cpu_temp_fd, self._gpu_temp_fd, *self._fan_fds.values()):
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            self._open_hwmon_fds()
+
+    def _build_acpi_command(self, wmi_code: str, args: list = None) -> Optional[bytes]:
         if args is None:
             args = []
 
         if not wmi_code.startswith('0x'):
             self.logger.error(f"SECURITY: Invalid WMI code format: {wmi_code}")
-            return "0x0"
+            return None
 
         for arg in args:
             if not str(arg).startswith('0x'):
                 self.logger.error(f"SECURITY: Invalid argument format: {arg}")
-                return "0x0"
+                return None
 
-        while len(args) < 4:
-            args.append("0x00")
+        return _format_acpi_command(self.acpi_base, wmi_code, tuple(str(a) for a in args))
 
-        args_str = ', '.join(str(a) for a in args)
-        command = f"{self.acpi_base} 0 {wmi_code} {{{args_str}}}"
+    def _acpi_call_real(self, wmi_code: str, args: list = None) -> str:
+        command = self._build_acpi_command(wmi_code, args)
+        if command is None:
+            return "0x0"
 
-        try:
-            with open(self.acpi_call_path, 'w') as f:
-                f.write(command)
+        result = self._acpi_transact(command).decode('ascii', 'ignore').strip()
 
-            with open(self.acpi_call_path, 'r') as f:
-                result = f.read().strip()
+        if result.startswith("{"):
+            result = result.strip("{}").split(",")[0].strip()
 
-            if result.startswith("{"):
-                result = result.strip("{}").split(",")[0].strip()
+        return result if result else "0x0"
 
-            self.logger.debug(f"ACPI call: {command} -> {result}")
-            return result if result else "0x0"
-        except Exception as e:
-            self.logger.error(f"ACPI call error: {e}")
-            return "0x0"
+    def _acpi_call_int(self, wmi_code: str, args: list = None) -> int:
+        command = self._build_acpi_command(wmi_code, args)
+        if command is None:
+            return -1
+
+        return self._acpi_query_int(command)
+
+    def _acpi_query_int(self, command: bytes) -> int:
+        return self._parse_acpi_int(self._acpi_transact(command))
+
+    @staticmethod
+    def _parse_acpi_int(buf: bytes) -> int:
+        start = buf.find(b'0x')
+        if start < 0:
+            return -1
+
+        end = start + 2
+        while end < len(buf) and buf[end] in b'0123456789abcdefABCDEF':
+            end += 1
+
+        if end == start + 2:
+            return -1
+        return int(buf[start + 2:end], 16)
+
+    def _open_acpi_fd(self) -> int:
+        if self._acpi_fd is None:
+            self._acpi_fd = os.open(self.acpi_call_path, os.O_RDWR)
+        return self._acpi_fd
+
+    def _acpi_transact(self, command: bytes) -> bytes:
+        with self._acpi_lock:
+            try:
+                fd = self._open_acpi_fd()
+                os.write(fd, command)
+                result = os.pread(fd, 64, 0)
+            except Exception as e:
+                self.logger.error(f"ACPI call error: {e}")
+                self.close()
+                return b""
+
+        end = result.find(b"\x00")
+        if end != -1:
+            result = result[:end]
+        result = result.rstrip(b"\n ")
+        self.logger.debug("ACPI call: %s -> %s", command, result)
+        return result
+
+    def close(self):
+        with self._acpi_lock:
+            if self._acpi_fd is not None:
+                try:
+                    os.close(self._acpi_fd)
+                except OSError:
+                    pass
+                self._acpi_fd = None
+
+    def close_hwmon(self):
+        for fd in (self._cpu_temp_fd, self._gpu_temp_fd, self._gpu_pm_fd, *self._fan_fds.values()):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+        self._cpu_temp_fd = None
+        self._gpu_temp_fd = None
+        self._gpu_pm_fd = None
+        self._fan_fds = {1: None, 2: None}
+
+    def read_all(self) -> dict:
+        with self._acpi_lock:
+            # A runtime-suspended dGPU has no meaningful die temperature; report
+            # None so the GUI can show it as suspended instead of a stale number.
+            gpu_suspended = self._gpu_suspended()
+            return {
+                "temps": {
+                    "cpu_temp": self.get_cpu_temp(),
+                    "gpu_temp": None if gpu_suspended else self.get_gpu_temp()
+                },
+                "fans": {
+                    "fan1_rpm": self.get_fan_rpm(1),
+                    "fan2_rpm": self.get_fan_rpm(2),
+                    "fan1_boost": self.get_fan_boost(1),
+                    "fan2_boost": self.get_fan_boost(2),
+                    "fan1_manual": self.manual_fan_control.get(1, False),
+                    "fan2_manual": self.manual_fan_control.get(2, False)
+                },
+                "power": {
+                    "current_mode": self.get_power_mode().label,
+                    "g_mode": self.g_mode_active
+                },
+                "status": {
+                    "model": self.model,
+                    "hwmon_available": self.hwmon_path is not None,
+                    "g_mode_active": self.g_mode_active,
+                    "gpu_suspended": gpu_suspended
+                }
+            }
+
+    def _cached(self, key, ttl: float, fn):
+        now = time.monotonic()
+        with self._acpi_lock:
+            slow_scans = self._slow_sensors.get(key, 0)
+            if slow_scans:
+                ttl *= 4
+
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+
+            start = time.perf_counter_ns()
+            value = fn()
+            elapsed = time.perf_counter_ns() - start
+
+            if elapsed > self._slow_read_ns:
+                if not slow_scans:
+                    self.logger.warning(f"Slow sensor read {key}: {elapsed // 1_000_000} ms, backing off")
+                self._slow_sensors[key] = self._slow_backoff_scans
+            elif slow_scans:
+                self._slow_sensors[key] = slow_scans - 1
+
+            self._cache[key] = (now, value)
+            return value
+
+    def invalidate(self, key=None):
+        with self._acpi_lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
 
     def get_cpu_temp(self) -> int:
-        if self.hwmon_path and 1 in self.hwmon_temps:
-            temp_millidegrees = self._read_hwmon_sensor(self.hwmon_temps[1])
+        return self._cached(('cpu_temp',), self._cache_ttl, self._read_cpu_temp_uncached)
+
+    def get_gpu_temp(self) -> int:
+        return self._cached(('gpu_temp',), self._cache_ttl, self._read_gpu_temp_uncached)
+
+    def get_fan_rpm(self, fan_id: int) -> int:
+        if not isinstance(fan_id, int) or fan_id not in [1, 2]:
+            self.logger.error(f"SECURITY: Invalid fan_id: {fan_id}")
+            return 0
+
+        return self._cached(('fan_rpm', fan_id), self._cache_ttl,
+                            lambda: self._read_fan_rpm_uncached(fan_id))
+
+    def _read_cpu_temp_uncached(self) -> int:
+        if self._cpu_temp_fd is not None:
+            temp_millidegrees = self._read_hwmon_fd(self._cpu_temp_fd)
             if temp_millidegrees > 0:
                 temp_celsius = temp_millidegrees // 1000
                 if 0 <= temp_celsius <= 120:
                     return temp_celsius
 
-        result = self._acpi_call_real("0x14", ["0x04", "0x01"])
-        try:
-            temp = int(result, 16)
-            if 0 <= temp <= 120:
-                return temp
-        except:
-            pass
+        temp = self._acpi_query_int(self._cmd_cpu_temp)
+        if 0 <= temp <= 120:
+            return temp
 
         return 45
 
-    def get_gpu_temp(self) -> int:
-        if self.hwmon_path and 2 in self.hwmon_temps:
-            temp_millidegrees = self._read_hwmon_sensor(self.hwmon_temps[2])
+    def _read_gpu_temp_uncached(self) -> int:
+        if self._gpu_temp_fd is not None:
+            temp_millidegrees = self._read_hwmon_fd(self._gpu_temp_fd)
             if temp_millidegrees > 0:
                 temp_celsius = temp_millidegrees // 1000
                 if 0 <= temp_celsius <= 120:
                     return temp_celsius
 
-        result = self._acpi_call_real("0x14", ["0x04", "0x02"])
-        try:
-            temp = int(result, 16)
-            if 0 <= temp <= 120:
-                return temp
-        except:
-            pass
+        temp = self._acpi_query_int(self._cmd_gpu_temp)
+        if 0 <= temp <= 120:
+            return temp
 
         return 50
 
-    def get_fan_rpm(self, fan_id: int) -> int:
-        if not isinstance(fan_id, int) or fan_id not in [1, 2]:
-            self.logger.error(f"SECURITY: Invalid fan_id: {fan_id}")
-            return 0
-
-        if self.hwmon_path and fan_id in self.hwmon_fans:
-            rpm = self._read_hwmon_sensor(self.hwmon_fans[fan_id])
+    def _read_fan_rpm_uncached(self, fan_id: int) -> int:
+        fan_fd = self._fan_fds[fan_id]
+        if fan_fd is not None:
+            rpm = self._read_hwmon_fd(fan_fd)
             if 0 <= rpm <= 10000:
                 return rpm
 
-        sensor_id = f"0x{0x32 + fan_id - 1:02X}"
-        result = self._acpi_call_real("0x14", ["0x05", sensor_id])
-        try:
-            rpm = int(result, 16)
-            if 0 <= rpm <= 10000:
-                return rpm
-        except:
-            pass
+        rpm = self._acpi_query_int(self._cmd_fan_rpm[fan_id])
+        if 0 <= rpm <= 10000:
+            return rpm
 
         return 2500 if fan_id == 1 else 2300
 
@@ -517,25 +835,42 @@ class G15HardwareController:
         return self.current_mode
 
     def get_g_mode_status(self) -> bool:
-        result = self._acpi_call_real("0x25", ["0x02"])
-        return result == "0x1"
+        return self._cached(('g_mode',), self._cache_ttl,
+                            lambda: self._acpi_query_int(self._cmd_g_mode_status) == 1)
+
+    def _recently_written(self, key, value) -> bool:
+        # Only back-to-back duplicates are skipped: the EC may change these
+        # registers on its own (e.g. across suspend), so re-applying the same
+        # value later must still reach the hardware.
+        entry = self._last_written.get(key)
+        return (entry is not None and entry[0] == value and
+                time.monotonic() - entry[1] < self._write_dedupe_window)
 
     def set_power_mode(self, mode: PowerMode, save_config: bool = True) -> bool:
         if not isinstance(mode, PowerMode):
             self.logger.error(f"SECURITY: Invalid power mode type: {type(mode)}")
             return False
 
-        self.logger.info(f"CONTROL: Setting power mode to {mode.value[0]}")
+        self.logger.info(f"CONTROL: Setting power mode to {mode.label}")
 
         self.current_mode = mode
         if mode == PowerMode.CUSTOM:
             self.manual_mode = True
+            self._last_written.pop('power_mode', None)
         else:
             self.manual_mode = False
-            self._acpi_call_real("0x15", ["0x01", mode.value[1]])
+            if not self._recently_written('power_mode', mode):
+                self._acpi_call_real("0x15", ["0x01", mode.code])
+                # A mode write makes the EC reset both fan boosts, so their
+                # dedupe records no longer describe the hardware.
+                for fan_id in FAN_SENSOR_IDS:
+                    self._last_written.pop(('boost', fan_id), None)
+                self._last_written['power_mode'] = (mode, time.monotonic())
             self.current_fan_boosts = {1: 0, 2: 0}
             self.manual_fan_control = {1: False, 2: False}
 
+        self.invalidate()
+
         if save_config:
             self._save_current_config()
 
@@ -552,35 +887,43 @@ class G15HardwareController:
 
         self.logger.info(f"CONTROL: Setting fan {fan_id} boost to {percentage}%")
 
-        sensor_id = f"0x{0x32 + fan_id - 1:02X}"
-        hex_value = f"0x{percentage:02X}"
-        self._acpi_call_real("0x15", ["0x02", sensor_id, hex_value])
+        key = ('boost', fan_id)
+        if not self._recently_written(key, percentage):
+            self._acpi_call_real("0x15", ["0x02", FAN_SENSOR_IDS[fan_id], BOOST_HEX[percentage]])
+            self._last_written[key] = (percentage, time.monotonic())
         
         self.current_fan_boosts[fan_id] = percentage
         if is_manual:
             self.manual_fan_control[fan_id] = (percentage > 0)
         
+        self.invalidate(('fan_rpm', fan_id))
+
         if save_config:
             self._save_current_config()
 
         return True
 
     def enable_g_mode(self, save_config: bool = True) -> bool:
+        if self.g_mode_active:
+            return True
+
         self.logger.info("CONTROL: Enabling G-Mode")
         
-        if not self.g_mode_active:
-            self.pre_gmode_state = {
-                'mode': self.current_mode,
-                'fan_boosts': self.current_fan_boosts.copy(),
-                'manual_control': self.manual_fan_control.copy()
-            }
+        self.pre_gmode_state = {
+            'mode': self.current_mode,
+            'fan_boosts': self.current_fan_boosts.copy(),
+            'manual_control': self.manual_fan_control.copy()
+        }
         
         self.g_mode_active = True
+        self._last_written.clear()
         
         self._acpi_call_real("0x25", ["0x01", "0x01"])
         time.sleep(0.05)
         self._acpi_call_real("0x15", ["0x01", "0xab"])
         
+        self.invalidate()
+
         if save_config:
             self._save_current_config()
         
@@ -589,6 +932,7 @@ class G15HardwareController:
     def disable_g_mode(self, save_config: bool = True) -> bool:
         self.logger.info("CONTROL: Disabling G-Mode")
         self.g_mode_active = False
+        self._last_written.clear()
         
         self._acpi_call_real("0x25", ["0x01", "0x00"])
         time.sleep(0.1)
@@ -598,7 +942,7 @@ class G15HardwareController:
             fan_boosts = self.pre_gmode_state['fan_boosts']
             manual_control = self.pre_gmode_state['manual_control']
             
-            self._acpi_call_real("0x15", ["0x01", PowerMode.BALANCED.value[1]])
+            self._acpi_call_real("0x15", ["0x01", PowerMode.BALANCED.code])
             time.sleep(0.1)
             
             if mode == PowerMode.CUSTOM:
@@ -612,8 +956,10 @@ class G15HardwareController:
             
             self.pre_gmode_state = None
         else:
-            self._acpi_call_real("0x15", ["0x01", self.current_mode.value[1]])
+            self._acpi_call_real("0x15", ["0x01", self.current_mode.code])
         
+        self.invalidate()
+
         if save_config:
             self._save_current_config()
         
@@ -703,7 +1049,7 @@ class G15DaemonServer:
             if action == 'authenticate':
                 token = self.generate_session_token()
                 self.active_sessions[token] = time.time()
-                return {"status": "success", "token": token}
+                return {"status": "success", "token": token, "msgpack": msgpack is not None}
 
             elif action == 'get_status':
                 return {
@@ -742,19 +1088,17 @@ class G15DaemonServer:
                 return {
                     "status": "success",
                     "data": {
-                        "current_mode": mode.value[0],
+                        "current_mode": mode.label,
                         "g_mode": self.hardware.g_mode_active
                     }
                 }
 
             elif action == 'set_power_mode':
                 mode_name = request_data.get('mode', '')
-                mode_map = {mode.value[0]: mode for mode in PowerMode}
-
-                if mode_name not in mode_map:
+                if mode_name not in MODE_BY_NAME:
                     return {"status": "error", "message": "Invalid power mode"}
 
-                success = self.hardware.set_power_mode(mode_map[mode_name])
+                success = self.hardware.set_power_mode(MODE_BY_NAME[mode_name])
                 return {"status": "success" if success else "error"}
 
             elif action == 'set_fan_boost':
@@ -770,29 +1114,7 @@ class G15DaemonServer:
             elif action == 'get_all_data':
                 return {
                     "status": "success",
-                    "data": {
-                        "temps": {
-                            "cpu_temp": self.hardware.get_cpu_temp(),
-                            "gpu_temp": self.hardware.get_gpu_temp()
-                        },
-                        "fans": {
-                            "fan1_rpm": self.hardware.get_fan_rpm(1),
-                            "fan2_rpm": self.hardware.get_fan_rpm(2),
-                            "fan1_boost": self.hardware.get_fan_boost(1),
-                            "fan2_boost": self.hardware.get_fan_boost(2),
-                            "fan1_manual": self.hardware.manual_fan_control.get(1, False),
-                            "fan2_manual": self.hardware.manual_fan_control.get(2, False)
-                        },
-                        "power": {
-                            "current_mode": self.hardware.get_power_mode().value[0],
-                            "g_mode": self.hardware.g_mode_active
-                        },
-                        "status": {
-                            "model": self.hardware.model,
-                            "hwmon_available": self.hardware.hwmon_path is not None,
-                            "g_mode_active": self.hardware.g_mode_active
-                        }
-                    }
+                    "data": self.hardware.read_all()
                 }
 
             elif action == 'toggle_g_mode':
@@ -805,26 +1127,83 @@ class G15DaemonServer:
 
         return {"status": "error", "message": "Unknown error"}
 
+    def _recv_exact(self, client_socket, size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = client_socket.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionResetError("client closed the connection mid-message")
+            buf += chunk
+        return bytes(buf)
+
+    def _recv_legacy(self, client_socket, data: bytes) -> bytes:
+        # Unframed requests carry no length, so read only until the bytes so far
+        # parse as JSON; another blocking recv would stall until the client times out.
+        while len(data) <= MAX_MESSAGE_SIZE:
+            try:
+                json.loads(data.decode('utf-8'))
+                return data
+            except ValueError:
+                pass
+            chunk = client_socket.recv(4096)
+            if not chunk:
+                return data
+            data += chunk
+        return data
+
+    def _decode_message(self, data: bytes):
+        if data.startswith(b'{') or msgpack is None:
+            return json.loads(data.decode('utf-8')), False
+        return msgpack.unpackb(data, raw=False), True
+
+    def _send_message(self, client_socket, message: dict, framed: bool, binary: bool = False):
+        if binary:
+            body = msgpack.packb(message, use_bin_type=True)
+        else:
+            body = json.dumps(message).encode('utf-8')
+        if framed:
+            client_socket.sendall(FRAME_HEADER.pack(len(body)) + body)
+        else:
+            client_socket.sendall(body)
+
     def handle_client(self, client_socket, client_addr):
         try:
-            data = client_socket.recv(4096)
-            if not data:
-                return
+            while self.running:
+                header = client_socket.recv(FRAME_HEADER.size)
+                if not header:
+                    return
+
+                # Clients predating length-prefixed framing send a bare JSON object.
+                framed = not header.startswith(b'{')
+                if framed:
+                    header += self._recv_exact(client_socket, FRAME_HEADER.size - len(header))
+                    (length,) = FRAME_HEADER.unpack(header)
+                    if length > MAX_MESSAGE_SIZE:
+                        self.logger.error(f"SECURITY: Oversized message ({length} bytes) from {client_addr}")
+                        return
+                    data = self._recv_exact(client_socket, length)
+                else:
+                    data = self._recv_legacy(client_socket, header)
 
-            request_data = json.loads(data.decode('utf-8'))
+                try:
+                    request_data, binary = self._decode_message(data)
+                except ValueError:
+                    self.logger.error(f"SECURITY: Invalid message from {client_addr}")
+                    self._send_message(client_socket, {"status": "error", "message": "Invalid JSON"}, framed)
+                    return
 
-            if not self.validate_request(str(client_addr), request_data):
-                response = {"status": "error", "message": "Request validation failed"}
-            else:
-                response = self.process_request(request_data)
+                if not isinstance(request_data, dict):
+                    response = {"status": "error", "message": "Request validation failed"}
+                elif not self.validate_request(str(client_addr), request_data):
+                    response = {"status": "error", "message": "Request validation failed"}
+                else:
+                    response = self.process_request(request_data)
 
-            response_json = json.dumps(response)
-            client_socket.send(response_json.encode('utf-8'))
+                self._send_message(client_socket, response, framed, binary)
+
+                if not framed:
+                    return
 
-        except json.JSONDecodeError:
-            self.logger.error(f"SECURITY: Invalid JSON from {client_addr}")
-            error_response = {"status": "error", "message": "Invalid JSON"}
-            client_socket.send(json.dumps(error_response).encode('utf-8'))
         except Exception as e:
             self.logger.error(f"Error handling client {client_addr}: {e}")
         finally:
@@ -886,6 +1265,9 @@ class G15DaemonServer:
         if self.server_socket:
             self.server_socket.close()
 
+        self.hardware.close()
+        self.hardware.close_hwmon()
+
         if os.path.exists(self.socket_path):
             os.unlink(self.socket_path)
 
@@ -899,11 +1281,17 @@ def signal_handler(signum, frame):
     sys.exit(0)
 
 
+STARTUP_BANNER = (
+    "Starting Dell G15 Control Center Daemon...\n"
+    "WARNING: This daemon runs with root privileges\n"
+    "All operations are logged for security audit\n"
+    "Configuration will be saved to /etc/g15-daemon/config.json\n"
+)
+
+
 def main():
-    print("Starting Dell G15 Control Center Daemon...")
-    print("WARNING: This daemon runs with root privileges")
-    print("All operations are logged for security audit")
-    print("Configuration will be saved to /etc/g15-daemon/config.json")
+    sys.stdout.write(STARTUP_BANNER)
+    sys.stdout.flush()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -10,6 +10,7 @@ readonly SERVICE_FILE="/etc/systemd/system/g15-daemon.service"
 readonly DESKTOP_FILE="/usr/share/applications/${APP_NAME}.desktop"
 readonly HWDB_FILE="/etc/udev/hwdb.d/90-dell-g15-gmode.hwdb"
 readonly CONFIG_DIR="/etc/g15-daemon"
+readonly CACHE_DIR="/var/cache/g15-daemon"
 
 readonly RED='\033[0;31m'
 readonly GREEN='\033[0;32m'
@@ -160,6 +161,11 @@ remove_configs() {
         log "Diretório de configurações não encontrado: $CONFIG_DIR"
     fi
     
+    if [[ -d "$CACHE_DIR" ]]; then
+        execute "rm -rf '$CACHE_DIR'"
+        log "Cache removido: $CACHE_DIR"
+    fi
+    
     if [[ -S "/tmp/g15-daemon.sock" ]]; then
         execute "rm /tmp/g15-daemon.sock"
         log "Socket removido"